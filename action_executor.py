@@ -1,19 +1,196 @@
 import os
+import time
+import ctypes
+import threading
 import subprocess
 import webbrowser
-import pygetwindow as gw
-import urllib.parse
-from typing import Dict, Any
+from ctypes import wintypes
+from urllib.parse import quote_plus
+from typing import Dict, Any, List, Optional, Tuple
 
 from app_registry import AppRegistry
 
+# How long an enumerated window list stays valid, in seconds
+WINDOW_CACHE_TTL = 0.5
+
+# Seconds to wait for the window event hooks to be installed
+WATCHER_START_TIMEOUT = 1.0
+
+# Longest window title read when enumerating windows
+MAX_TITLE_LENGTH = 512
+
+# Window message asking a window to close, as if the user clicked X
+WM_CLOSE = 0x0010
+
+# WinEvents that change which top-level windows exist, are visible, or what they're called.
+# CREATE through HIDE are consecutive so they share one hook.
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_HIDE = 0x8003
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+
+user32 = ctypes.WinDLL("user32")
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+
+# Declare signatures up front so ctypes doesn't guess argument types on every call
+user32.EnumWindows.argtypes = (WNDENUMPROC, wintypes.LPARAM)
+user32.EnumWindows.restype = wintypes.BOOL
+user32.IsWindowVisible.argtypes = (wintypes.HWND,)
+user32.IsWindowVisible.restype = wintypes.BOOL
+user32.GetWindowTextW.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+user32.GetWindowTextW.restype = ctypes.c_int
+user32.PostMessageW.argtypes = (wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+user32.PostMessageW.restype = wintypes.BOOL
+user32.SetWinEventHook.argtypes = (
+    wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WINEVENTPROC,
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+)
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+user32.UnhookWinEvent.restype = wintypes.BOOL
+user32.GetMessageW.argtypes = (ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT)
+user32.GetMessageW.restype = wintypes.BOOL
+user32.DispatchMessageW.argtypes = (ctypes.POINTER(wintypes.MSG),)
+
+# Search results page, the encoded query is appended
+SEARCH_URL = "https://www.google.com/search?q="
+
+# Argument passed to a handler when its parameter is missing
+_EMPTY = ""
+
+# Console applications get their own window rather than sharing ours, and
+# launched applications don't receive our Ctrl+C. No effect on GUI apps.
+LAUNCH_FLAGS = subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NEW_PROCESS_GROUP
+
+def _enum_windows() -> List[Tuple[str, int]]:
+    """
+    Get all visible top-level windows that have a title.
+    
+    Calls EnumWindows directly rather than building a wrapper object per
+    window, reusing a single buffer for the titles.
+    
+    Returns:
+        List[Tuple[str, int]]: (title, window handle) pairs
+    """
+    windows = []
+    title = ctypes.create_unicode_buffer(MAX_TITLE_LENGTH)
+    
+    def callback(hwnd, _):
+        if user32.IsWindowVisible(hwnd) and user32.GetWindowTextW(hwnd, title, MAX_TITLE_LENGTH):
+            windows.append((title.value, hwnd))
+        return True
+    
+    user32.EnumWindows(WNDENUMPROC(callback), 0)
+    return windows
+
+class _WindowWatcher:
+    """
+    Watches for top-level windows being created, destroyed, shown, hidden or renamed.
+    
+    WinEvent hooks are installed on a background thread that pumps their
+    messages. Whenever a window event arrives the changed flag is set, so an
+    enumerated window list can be reused until it's actually out of date.
+    """
+    
+    def __init__(self):
+        # Set when the window list has changed since it was last cleared
+        self.changed = threading.Event()
+        
+        # False if the hooks couldn't be installed and changes can't be seen
+        self.active = False
+        
+        # Keep a reference to the callback so it isn't garbage collected
+        self._callback = WINEVENTPROC(self._on_event)
+        
+        # Wait until the hooks are installed so active is accurate. If that takes
+        # too long, active stays False and callers fall back to the cache TTL.
+        ready = threading.Event()
+        threading.Thread(target=self._run, args=(ready,), name="window-watcher", daemon=True).start()
+        ready.wait(WATCHER_START_TIMEOUT)
+    
+    def _run(self, ready: threading.Event):
+        """Install the hooks and pump messages so their events are delivered"""
+        flags = WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS
+        hooks = []
+        try:
+            for first, last in ((EVENT_OBJECT_CREATE, EVENT_OBJECT_HIDE),
+                                (EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE)):
+                hooks.append(user32.SetWinEventHook(first, last, None, self._callback, 0, 0, flags))
+            self.active = all(hooks)
+        except Exception:
+            # Hooks unavailable, callers fall back to the cache TTL
+            self.active = False
+        finally:
+            # Never leave the constructor waiting
+            ready.set()
+        
+        if self.active:
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.DispatchMessageW(ctypes.byref(msg))
+        
+        for hook in hooks:
+            if hook:
+                user32.UnhookWinEvent(hook)
+        self.active = False
+    
+    def _on_event(self, hook, event, hwnd, id_object, id_child, thread_id, event_time):
+        """Flag a change for events about windows themselves, not their contents"""
+        if id_object == OBJID_WINDOW and id_child == CHILDID_SELF:
+            self.changed.set()
+
 class ActionExecutor:
     """
     Executes actions based on the intent determined by the NLP processor.
     """
     
     def __init__(self):
-        self.app_registry = AppRegistry()
+        # Built on first use, see app_registry
+        self._app_registry = None
+        self._app_registry_lock = threading.Lock()
+        
+        # (timestamp, [(title, window handle), ...]) from the last enumeration
+        self._win_cache = (0.0, [])
+        
+        # Started on the first close, see _get_windows
+        self._window_watcher = None
+        
+        # DevTools port of a Chrome started with --remote-debugging-port, if any
+        self._chrome_debug_port = os.getenv("CHROME_DEBUG_PORT")
+        self._http = None
+        if self._chrome_debug_port:
+            # Only the DevTools fast path needs requests, so only import it then
+            import requests
+            self._http = requests.Session()
+        
+        # Handler for each intent and the parameter it takes
+        self._intents = {
+            "open": self._open_application,
+            "close": self._close_application,
+            "search": self._perform_search,
+        }
+        self._param_key = {
+            "open": "application",
+            "close": "application",
+            "search": "query",
+        }
+    
+    @property
+    def app_registry(self) -> AppRegistry:
+        """The application registry, created the first time it is needed"""
+        if self._app_registry is None:
+            # Warm-up and the first command may get here at the same time
+            with self._app_registry_lock:
+                if self._app_registry is None:
+                    self._app_registry = AppRegistry()
+        return self._app_registry
     
     def execute_action(self, intent: str, params: Dict[str, Any]) -> str:
         """
@@ -26,17 +203,12 @@ class ActionExecutor:
         Returns:
             str: Response message indicating the result of the action
         """
-        if intent == "open":
-            return self._open_application(params.get("application", ""))
-        
-        elif intent == "close":
-            return self._close_application(params.get("application", ""))
-        
-        elif intent == "search":
-            return self._perform_search(params.get("query", ""))
-        
-        else:
+        handler = self._intents.get(intent)
+        if handler is None:
             return "I'm not sure what you want me to do. Can you be more specific?"
+        
+        key = self._param_key[intent]
+        return handler(params[key] if key in params else _EMPTY)
     
     def _open_application(self, app_name: str) -> str:
         """
@@ -59,7 +231,7 @@ class ActionExecutor:
         
         try:
             # Open the application
-            subprocess.Popen(executable_path)
+            subprocess.Popen([executable_path], close_fds=True, creationflags=LAUNCH_FLAGS)
             return f"Opening {app_name} for you."
         except Exception as e:
             return f"Error opening {app_name}: {str(e)}"
@@ -77,27 +249,60 @@ class ActionExecutor:
         if not app_name:
             return "I'm not sure which application you want me to close."
         
-        # Get the window title pattern from the app registry
-        window_pattern = self.app_registry.get_window_pattern(app_name)
+        # Get the compiled window title pattern from the app registry
+        window_regex = self.app_registry.get_window_regex(app_name)
         
-        if not window_pattern:
+        if not window_regex:
             return f"I don't know how to close '{app_name}'. Can you provide more details?"
         
         try:
-            # Find windows matching the pattern
-            matching_windows = [w for w in gw.getAllWindows() if window_pattern.lower() in w.title.lower()]
+            # Find windows matching the pattern, case-insensitively without lowercasing every title
+            search = window_regex.search
+            matching_windows = [hwnd for title, hwnd in self._get_windows() if search(title)]
             
             if not matching_windows:
                 return f"I couldn't find any open windows for {app_name}."
             
-            # Close all matching windows
-            for window in matching_windows:
-                window.close()
+            # Ask all matching windows to close, reusing the handles from the enumeration
+            post_message = user32.PostMessageW
+            for hwnd in matching_windows:
+                post_message(hwnd, WM_CLOSE, 0, 0)
+            
+            # The window list is stale now that windows have been closed
+            self._win_cache = (0.0, [])
             
             return f"Closed {app_name} for you."
         except Exception as e:
             return f"Error closing {app_name}: {str(e)}"
     
+    def _get_windows(self) -> List[Tuple[str, int]]:
+        """
+        Get all top-level windows paired with their titles.
+        
+        Enumerating windows is expensive, so the result is reused until a
+        window event says it changed, or for WINDOW_CACHE_TTL seconds if
+        window events can't be watched.
+        
+        Returns:
+            List[Tuple[str, int]]: (title, window handle) pairs
+        """
+        if self._window_watcher is None:
+            self._window_watcher = _WindowWatcher()
+        watcher = self._window_watcher
+        
+        timestamp, windows = self._win_cache
+        if watcher.active:
+            stale = not timestamp or watcher.changed.is_set()
+        else:
+            stale = time.monotonic() - timestamp >= WINDOW_CACHE_TTL
+        
+        if stale:
+            # Clear first so changes made while enumerating mark the new list stale
+            watcher.changed.clear()
+            windows = _enum_windows()
+            self._win_cache = (time.monotonic(), windows)
+        return windows
+    
     def _perform_search(self, query: str) -> str:
         """
         Perform a web search for the given query and open the results in a browser.
@@ -113,22 +318,62 @@ class ActionExecutor:
         
         try:
             # Format the query for a search URL
-            encoded_query = urllib.parse.quote_plus(query)
-            search_url = f"https://www.google.com/search?q={encoded_query}"
+            search_url = SEARCH_URL + quote_plus(query)
             
-            # Try to open in Chrome first
-            chrome_path = self.app_registry.get_app_path("chrome")
-            if chrome_path:
-                try:
-                    subprocess.Popen(f'"{chrome_path}" "{search_url}"')
-                except:
-                    # Fall back to default browser if Chrome fails
-                    webbrowser.open(search_url)
-            else:
-                # Use default browser if Chrome isn't found
-                webbrowser.open(search_url)
+            # Open a new tab in an already running Chrome if it accepts DevTools requests
+            if self._open_chrome_tab(search_url):
+                return f"I've opened a search for '{query}' in your browser."
+            
+            # Otherwise launch Chrome, or the default browser
+            self._launch_browser(self.app_registry.get_app_path("chrome"), search_url)
             
             return f"I've opened a search for '{query}' in your browser."
                 
         except Exception as e:
             return f"Error performing search: {str(e)}"
+    
+    def _launch_browser(self, chrome_path: Optional[str], url: str):
+        """
+        Open a URL in Chrome, or the default browser.
+        
+        Args:
+            chrome_path (Optional[str]): Path of the Chrome executable, if found
+            url (str): The URL to open
+        """
+        if chrome_path:
+            try:
+                subprocess.Popen([chrome_path, url], close_fds=True, creationflags=LAUNCH_FLAGS)
+                return
+            except:
+                # Fall back to default browser if Chrome fails
+                pass
+        
+        # Use default browser if Chrome isn't found or fails to start
+        webbrowser.open(url)
+    
+    def _open_chrome_tab(self, url: str) -> bool:
+        """
+        Open a URL in a new tab of the Chrome instance listening on CHROME_DEBUG_PORT.
+        
+        This is a single local HTTP request on a kept-alive connection instead
+        of starting a new chrome.exe process.
+        
+        Args:
+            url (str): The URL to open
+        
+        Returns:
+            bool: True if the tab was opened
+        """
+        if not self._chrome_debug_port:
+            return False
+        
+        import requests
+        try:
+            response = self._http.put(
+                f"http://127.0.0.1:{self._chrome_debug_port}/json/new?{url}",
+                timeout=0.5
+            )
+            return response.ok
+        except requests.RequestException:
+            # Chrome isn't running with remote debugging, launch it normally
+            return False
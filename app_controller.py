@@ -1,14 +1,19 @@
 import os
 import sys
-from dotenv import load_dotenv, find_dotenv
+import threading
 
 from nlp_processor import NLPProcessor
 from action_executor import ActionExecutor
 
+# Maximum number of interpreted commands to remember
+NLP_CACHE_SIZE = 512
+
 class AppController:
     """Main controller class for the AI assistant application."""
     
     def __init__(self):
+        from dotenv import load_dotenv, find_dotenv
+        
         # Load environment variables from .env file with better error handling
         env_file = find_dotenv()
         if not env_file:
@@ -22,13 +27,35 @@ class AppController:
             print("\nError: OPENAI_API_KEY not found in environment variables")
             print("Please create a .env file in the project root with your API key:")
             print("OPENAI_API_KEY=your_api_key_here")
-            print("OPENAI_MODEL=gpt-4o")
+            print("OPENAI_MODEL=gpt-4o-mini")
             sys.exit(1)
         
         # Initialize NLP processor and action executor
         self.nlp = NLPProcessor()
         self.executor = ActionExecutor()
         
+        # Interpreted commands keyed by normalized input, so repeats skip the API call
+        self._nlp_cache = {}
+    
+    def warm_up(self):
+        """
+        Do the slow first-use work ahead of time.
+        
+        Imports openai and opens the connection to the OpenAI API, then
+        discovers applications. Meant to run on a background thread while the
+        user types, so errors are ignored here and surface on the first real
+        command instead.
+        """
+        try:
+            self.nlp.client.models.list()
+        except Exception:
+            pass
+        
+        try:
+            self.executor.app_registry.get_app_path("chrome")
+        except Exception:
+            pass
+    
     def process_command(self, user_input):
         """
         Process a natural language command from the user.
@@ -40,12 +67,37 @@ class AppController:
             str: Response to the user
         """
         # Use NLP model to determine intent and extract parameters
-        intent, params = self.nlp.process_input(user_input)
+        intent, params = self._interpret(user_input)
         
         # Execute the appropriate action based on intent
         result = self.executor.execute_action(intent, params)
         
         return result
+    
+    def _interpret(self, user_input):
+        """
+        Determine the intent of a command, reusing earlier results for repeated commands.
+        
+        Args:
+            user_input (str): The user's natural language input
+        
+        Returns:
+            tuple: (intent, params) as returned by NLPProcessor.process_input
+        """
+        key = user_input.strip().lower()
+        if key in self._nlp_cache:
+            return self._nlp_cache[key]
+        
+        intent, params = self.nlp.process_input(user_input)
+        
+        # Don't remember failures, the next attempt may succeed
+        if intent != "unknown":
+            if len(self._nlp_cache) >= NLP_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._nlp_cache[next(iter(self._nlp_cache))]
+            self._nlp_cache[key] = (intent, params)
+        
+        return intent, params
 
 def main():
     controller = AppController()
@@ -60,6 +112,8 @@ def main():
         print("AI Task Launcher - Your AI-powered Windows assistant")
         print("Type 'exit' or 'quit' to end the session")
         
+        threading.Thread(target=controller.warm_up, daemon=True).start()
+        
         while True:
             user_input = input("\nHow can I help you? > ")
             
@@ -1,10 +1,199 @@
 import os
+import re
 import sys
-from typing import Dict, Optional, List
+import json
+import time
+import hashlib
+import ctypes
+import functools
+import threading
+from ctypes import wintypes
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, Set, Tuple
 import winreg
 import subprocess
 from pathlib import Path
 
+from rapidfuzz import fuzz, process
+
+# Length of the substrings used to index window pattern names
+NGRAM_SIZE = 3
+
+# Discovered applications are cached here between runs
+CACHE_PATH = Path(os.environ.get("LOCALAPPDATA", Path.home()), "ai-task-launcher", "apps.json")
+
+# Rediscover applications once the cache is older than this, in seconds
+CACHE_MAX_AGE = 24 * 60 * 60
+
+# Number of lookup results remembered per AppRegistry
+LOOKUP_CACHE_SIZE = 256
+
+# Minimum rapidfuzz WRatio score (0-100) for a fuzzy application name match.
+# High enough that only near-substrings match, since a wrong match launches
+# an unrelated executable.
+APP_MATCH_CUTOFF = 90
+
+ERROR_SUCCESS = 0
+ERROR_MORE_DATA = 234
+
+# RegGetValueW flag accepting REG_SZ, and REG_EXPAND_SZ expanded to REG_SZ
+RRF_RT_REG_SZ = 0x00000002
+
+advapi32 = ctypes.WinDLL("advapi32")
+advapi32.RegGetValueW.argtypes = (
+    wintypes.HKEY, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+    ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p, ctypes.POINTER(wintypes.DWORD)
+)
+advapi32.RegGetValueW.restype = wintypes.LONG
+
+def _get_string_value(key: winreg.HKEYType, subkey_name: str, name: str) -> Optional[str]:
+    """
+    Read a string value of a subkey without opening the subkey first.
+    
+    RegGetValueW opens the subkey, reads the value and closes it in one call.
+    
+    Args:
+        key (winreg.HKEYType): Open parent registry key
+        subkey_name (str): Name of the subkey relative to key
+        name (str): Name of the value to read
+    
+    Returns:
+        Optional[str]: The value, or None if it's missing or not a string
+    """
+    # Retry with the size the call asks for if the value doesn't fit
+    size = wintypes.DWORD(512)
+    status = ERROR_MORE_DATA
+    while status == ERROR_MORE_DATA:
+        buffer = ctypes.create_unicode_buffer(size.value // ctypes.sizeof(ctypes.c_wchar) + 1)
+        size = wintypes.DWORD(ctypes.sizeof(buffer))
+        status = advapi32.RegGetValueW(
+            key.handle, subkey_name, name, RRF_RT_REG_SZ, None, buffer, ctypes.byref(size)
+        )
+    if status != ERROR_SUCCESS:
+        return None
+    return buffer.value
+
+def _cache_token() -> str:
+    """
+    Fingerprint the environment that discovery depends on.
+    
+    Installing or removing an application usually changes PATH or the
+    modification time of one of the install directories, which changes the
+    token and invalidates the cache.
+    
+    Returns:
+        str: Hex digest of the relevant environment variables and directory mtimes
+    """
+    system_root = os.environ.get("SystemRoot", r"C:\Windows")
+    program_files = os.environ.get("ProgramFiles", r"C:\Program Files")
+    program_files_x86 = os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)")
+    
+    token = hashlib.blake2b(digest_size=16)
+    for value in (program_files, program_files_x86, os.environ.get("PATH", "")):
+        token.update(value.encode("utf-8", "surrogatepass") + b"\0")
+    for directory in (program_files, program_files_x86, os.path.join(system_root, "SysWOW64")):
+        try:
+            token.update(str(os.stat(directory).st_mtime_ns).encode() + b"\0")
+        except OSError:
+            token.update(b"-\0")
+    return token.hexdigest()
+
+def _ngrams(text: str) -> Set[str]:
+    """Get all substrings of length NGRAM_SIZE in the text"""
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+def _rank_match(app_name: str, name: str, preferred) -> Tuple[bool, bool, int]:
+    """
+    Rank a name matched for a lookup, used to choose between several matches.
+    
+    Whole-word matches come first, then well-known applications over names
+    taken from publishers (e.g. "word" over "microsoft" for "microsoft word"),
+    then names found further right in the lookup, since the product name
+    usually follows the publisher ("microsoft outlook").
+    
+    Args:
+        app_name (str): Lowercased name being looked up
+        name (str): Lowercased name that matched
+        preferred: Names of well-known applications
+    
+    Returns:
+        Tuple[bool, bool, int]: Sort key, higher is better
+    """
+    whole_word = bool(
+        re.search(rf"\b{re.escape(name)}\b", app_name)
+        or re.search(rf"\b{re.escape(app_name)}\b", name)
+    )
+    return (whole_word, name in preferred, app_name.rfind(name))
+
+class _NameIndex:
+    """
+    Finds names that contain, or are contained in, a lookup name without scanning them all.
+    
+    A name containing the lookup name has every n-gram of it, so candidates
+    come from intersecting n-gram buckets. Names contained in the lookup name
+    are found by one scan with an alternation regex of all names.
+    """
+    
+    def __init__(self):
+        # Names in the order they were added, mapped to that position
+        self._names: Dict[str, int] = {}
+        self._ngrams: Dict[str, Set[str]] = {}
+        
+        # Rebuilt on the next lookup after names are added
+        self._regex: Optional[re.Pattern] = None
+    
+    def add(self, name: str):
+        """
+        Add a name to the index.
+        
+        Args:
+            name (str): Lowercased name
+        """
+        if not name or name in self._names:
+            return
+        
+        self._names[name] = len(self._names)
+        for gram in _ngrams(name):
+            self._ngrams.setdefault(gram, set()).add(name)
+        self._regex = None
+    
+    def find(self, app_name: str, preferred=()) -> Optional[str]:
+        """
+        Find a name that contains, or is contained in, app_name.
+        
+        Args:
+            app_name (str): Lowercased name to look up
+            preferred: Names of well-known applications, see _rank_match
+        
+        Returns:
+            Optional[str]: The matching name or None if not found
+        """
+        # Names containing app_name, preferring the shortest
+        grams = _ngrams(app_name)
+        if grams:
+            buckets = sorted((self._ngrams.get(gram, set()) for gram in grams), key=len)
+            candidates = buckets[0].intersection(*buckets[1:])
+        else:
+            # Too short to have n-grams, check every name
+            candidates = self._names
+        
+        matches = [name for name in candidates if app_name in name]
+        if matches:
+            return min(matches, key=lambda name: (len(name), name))
+        
+        # Names contained in app_name. The lookahead finds a match at every
+        # position, longest first, instead of only the leftmost one.
+        if not self._names:
+            return None
+        if self._regex is None:
+            names = sorted(self._names, key=lambda name: (-len(name), name))
+            self._regex = re.compile("(?=(" + "|".join(map(re.escape, names)) + "))")
+        
+        matches = {match.group(1) for match in self._regex.finditer(app_name)}
+        if not matches:
+            return None
+        return max(matches, key=lambda name: (*_rank_match(app_name, name, preferred), -self._names[name]))
+
 class AppRegistry:
     """
     Manages the registry of applications and their executable paths.
@@ -16,21 +205,21 @@ class AppRegistry:
         # Initialize empty application registry
         self.app_registry = {}
         
-        # Window title patterns for closing applications
+        # Lowercased window title patterns for closing applications
         self.window_patterns = {
-            "chrome": "Google Chrome",
-            "firefox": "Mozilla Firefox",
-            "edge": "Microsoft Edge",
-            "word": "Word",
-            "excel": "Excel",
-            "powerpoint": "PowerPoint",
-            "notepad": "Notepad",
-            "calculator": "Calculator",
-            "spotify": "Spotify",
-            "explorer": "File Explorer",
-            "paint": "Paint",
-            "cmd": "Command Prompt",
-            "powershell": "Windows PowerShell",
+            "chrome": "google chrome",
+            "firefox": "mozilla firefox",
+            "edge": "microsoft edge",
+            "word": "word",
+            "excel": "excel",
+            "powerpoint": "powerpoint",
+            "notepad": "notepad",
+            "calculator": "calculator",
+            "spotify": "spotify",
+            "explorer": "file explorer",
+            "paint": "paint",
+            "cmd": "command prompt",
+            "powershell": "windows powershell",
         }
         
         # Common application names and their executable filenames
@@ -50,11 +239,108 @@ class AppRegistry:
             "powershell": ["powershell.exe"],
         }
         
-        # Common installation directories to search
-        self.search_paths = self._get_search_paths()
+        # Inverted index from lowercased executable filename to application name
+        self._exe_to_app = {
+            exe_name.lower(): app_name
+            for app_name, exe_names in self.common_apps.items()
+            for exe_name in exe_names
+        }
+        
+        # Common installation directories to search, filled in by discovery
+        self.search_paths = []
+        
+        # Compiled window title patterns, keyed by pattern
+        self._pattern_re_cache: Dict[str, re.Pattern] = {}
+        
+        # Memoized lookups by lowercased name, cleared whenever the registry changes.
+        # Wrapping the bound methods keeps the caches per instance.
+        self._path_cache = functools.lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._lookup_app_path)
+        self._pattern_cache = functools.lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._lookup_window_pattern)
+        
+        # Index window pattern names so partial matches don't scan every entry
+        self._pattern_index = _NameIndex()
+        
+        # Applications are loaded or discovered on the first lookup, see _ensure_discovered
+        self._discovered = False
+        self._discover_lock = threading.Lock()
+        self._cache_token = None
+        self._discovered_at = time.time()
+    
+    def _ensure_discovered(self):
+        """
+        Load the cached applications, or discover them if the cache isn't valid.
+        
+        Runs once, on the first lookup, so creating an AppRegistry is cheap.
+        Concurrent callers wait for the first one to finish.
+        """
+        if self._discovered:
+            return
+        
+        with self._discover_lock:
+            if self._discovered:
+                return
+            
+            self._cache_token = _cache_token()
+            if not self._load_cache():
+                self.search_paths = self._get_search_paths()
+                self._discover_apps()
+            self._discovered = True
+    
+    def _load_cache(self) -> bool:
+        """
+        Load applications discovered by a previous run.
+        
+        The cache is only used if it was written for the same environment,
+        see _cache_token, and discovery ran less than CACHE_MAX_AGE ago.
+        
+        Returns:
+            bool: True if a valid cache was loaded
+        """
+        try:
+            with open(CACHE_PATH, encoding="utf-8") as f:
+                cache = json.load(f)
+            
+            if cache["token"] != self._cache_token:
+                return False
+            if time.time() - cache["discovered_at"] > CACHE_MAX_AGE:
+                return False
+            
+            self._discovered_at = cache["discovered_at"]
+            self.app_registry.update(cache["apps"])
+            self.window_patterns.update(
+                (name, pattern.lower()) for name, pattern in cache["patterns"].items()
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or corrupt cache, discover from scratch
+            return False
         
-        # Discover applications using multiple methods
-        self._discover_apps()
+        self._build_indexes()
+        return True
+    
+    def _save_cache(self):
+        """Save the known applications for future runs"""
+        cache = {
+            "token": self._cache_token,
+            "discovered_at": self._discovered_at,
+            "apps": self.app_registry,
+            "patterns": self.window_patterns,
+        }
+        try:
+            CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Write to a temporary file first so a partial write never replaces a good cache
+            temp_path = CACHE_PATH.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(temp_path, CACHE_PATH)
+        except OSError:
+            # Caching is only an optimization
+            pass
+    
+    def _build_indexes(self):
+        """Index every window pattern name"""
+        for name in self.window_patterns:
+            self._pattern_index.add(name)
     
     def _get_search_paths(self) -> List[str]:
         """Get common paths to search for applications"""
@@ -101,20 +387,50 @@ class AppRegistry:
     
     def _discover_apps(self):
         """Discover applications using multiple methods"""
-        # Method 1: Discover from Windows registry App Paths
-        self._discover_from_app_paths()
-        
-        # Method 2: Discover from Windows registry Uninstall information
-        self._discover_from_uninstall_registry()
-        
-        # Method 3: Search in common paths for known executables
-        self._discover_from_filesystem()
-        
-        # Method 4: Use where.exe to find executables in PATH
-        self._discover_from_where_command()
+        self._discovered_at = time.time()
+        try:
+            methods = [
+                # Method 1: Discover from Windows registry App Paths
+                self._discover_from_app_paths,
+                
+                # Method 2: Discover from Windows registry Uninstall information
+                self._discover_from_uninstall_registry,
+                
+                # Method 3: Search in common paths for known executables
+                self._discover_from_filesystem,
+                
+                # Method 4: Find executables in PATH
+                self._discover_from_path,
+            ]
+            
+            # Each method fills its own (apps, patterns) dicts so they can run
+            # concurrently; they mostly wait on the registry and filesystem
+            results = [({}, {}) for _ in methods]
+            with ThreadPoolExecutor(max_workers=len(methods), thread_name_prefix="discovery") as pool:
+                futures = [pool.submit(method, *result) for method, result in zip(methods, results)]
+                for future in futures:
+                    future.result()
+            
+            # Merge in method order so earlier methods take precedence, as when they ran one by one
+            for apps, patterns in results:
+                for name, path in apps.items():
+                    self.app_registry.setdefault(name, path)
+                for name, pattern in patterns.items():
+                    self.window_patterns.setdefault(name, pattern)
+            
+            self._save_cache()
+        finally:
+            # Index whatever was found, even if a method failed
+            self._build_indexes()
     
-    def _discover_from_app_paths(self):
-        """Discover applications from Windows registry App Paths"""
+    def _discover_from_app_paths(self, apps: Dict[str, str], patterns: Dict[str, str]):
+        """
+        Discover applications from Windows registry App Paths.
+        
+        Args:
+            apps (Dict[str, str]): Found application paths are added here
+            patterns (Dict[str, str]): Found window title patterns are added here
+        """
         try:
             # Open the App Paths registry key
             registry_key = winreg.OpenKey(
@@ -123,151 +439,202 @@ class AppRegistry:
                 0, winreg.KEY_READ
             )
             
-            # Enumerate subkeys
-            index = 0
-            while True:
+            # Enumerate subkeys, counting them up front instead of probing for the end
+            subkey_count, _, _ = winreg.QueryInfoKey(registry_key)
+            for index in range(subkey_count):
                 try:
                     # Get the next subkey
                     subkey_name = winreg.EnumKey(registry_key, index)
                     
                     # Extract the app name from the executable filename
-                    app_name = os.path.splitext(subkey_name)[0].lower()
+                    dot = subkey_name.rfind(".")
+                    app_name = (subkey_name[:dot] if dot > 0 else subkey_name).lower()
                     
                     # Open the subkey to get the executable path
-                    subkey = winreg.OpenKey(registry_key, subkey_name)
-                    path, _ = winreg.QueryValueEx(subkey, "")
-                    
-                    # Add to registry if path exists
-                    if os.path.exists(path):
-                        self.app_registry[app_name] = path
-                        # Also add a simple window pattern if not already present
-                        if app_name not in self.window_patterns:
-                            self.window_patterns[app_name] = app_name.title()
-                    
-                    index += 1
-                    
+                    with winreg.OpenKey(registry_key, subkey_name, 0, winreg.KEY_QUERY_VALUE) as subkey:
+                        path, _ = winreg.QueryValueEx(subkey, "")
                 except WindowsError:
-                    # No more subkeys
-                    break
-                    
+                    # Subkey without a readable path, skip it
+                    continue
+                
+                # Expand variables such as %ProgramFiles% in REG_EXPAND_SZ paths,
+                # checking for "%" first since most paths have none
+                if "%" in path:
+                    path = winreg.ExpandEnvironmentStrings(path)
+                
+                # Add to registry if path exists
+                if os.path.exists(path):
+                    apps[app_name] = path
+                    # Also add a simple window pattern
+                    patterns[app_name] = app_name
+        
         except Exception as e:
             # Just continue with other discovery methods if registry access fails
             pass
     
-    def _discover_from_uninstall_registry(self):
-        """Discover applications from Windows registry Uninstall information"""
+    def _discover_from_uninstall_registry(self, apps: Dict[str, str], patterns: Dict[str, str]):
+        """
+        Discover applications from Windows registry Uninstall information.
+        
+        Args:
+            apps (Dict[str, str]): Found application paths are added here
+            patterns (Dict[str, str]): Found window title patterns are added here
+        """
         try:
-            # Open the Uninstall registry key
-            registry_key = winreg.OpenKey(
+            # Open the Uninstall registry key, closing it as soon as we're done
+            with winreg.OpenKey(
                 winreg.HKEY_LOCAL_MACHINE,
                 r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall",
                 0, winreg.KEY_READ
-            )
-            
-            # Enumerate subkeys
-            index = 0
-            while True:
-                try:
-                    # Get the next subkey
-                    subkey_name = winreg.EnumKey(registry_key, index)
+            ) as registry_key:
+                # Enumerate subkeys, counting them up front instead of probing for the end
+                subkey_count, _, _ = winreg.QueryInfoKey(registry_key)
+                for index in range(subkey_count):
+                    try:
+                        # Get the next subkey
+                        subkey_name = winreg.EnumKey(registry_key, index)
+                    except WindowsError:
+                        # Unreadable subkey, just continue
+                        continue
                     
-                    # Open the subkey
-                    subkey = winreg.OpenKey(registry_key, subkey_name)
+                    # Read values through the parent key, one call each instead of opening
+                    # the subkey. Most entries have no install location, so read it first
+                    # and reject them before reading anything else.
+                    install_location = _get_string_value(registry_key, subkey_name, "InstallLocation")
+                    if not install_location:
+                        continue
+                    display_name = _get_string_value(registry_key, subkey_name, "DisplayName")
+                    if display_name is None:
+                        continue
                     
                     try:
-                        # Get display name and executable path
-                        display_name, _ = winreg.QueryValueEx(subkey, "DisplayName")
-                        install_location, _ = winreg.QueryValueEx(subkey, "InstallLocation")
-                        
                         # Clean up the display name and use as app name
                         app_name = display_name.lower().split()[0]
                         
-                        # Check if we can find an executable in the install location
-                        if install_location and os.path.exists(install_location):
-                            # Look for executables in the install location
-                            for file in os.listdir(install_location):
-                                if file.lower().endswith(".exe"):
-                                    exe_path = os.path.join(install_location, file)
-                                    # Add to registry if not already present
-                                    if app_name not in self.app_registry:
-                                        self.app_registry[app_name] = exe_path
-                                        # Also add a simple window pattern
-                                        if app_name not in self.window_patterns:
-                                            self.window_patterns[app_name] = display_name
-                                    break
-                    except:
-                        # Missing values, just continue
+                        # Only the first executable is used, so don't look if the app is already known
+                        if app_name in apps:
+                            continue
+                        
+                        # Stop at the first executable in the install location rather than
+                        # listing it all; scandir fails if it doesn't exist
+                        with os.scandir(install_location) as it:
+                            exe_path = next((
+                                entry.path for entry in it
+                                if entry.name.lower().endswith(".exe") and entry.is_file(follow_symlinks=False)
+                            ), None)
+                        
+                        if exe_path:
+                            apps[app_name] = exe_path
+                            # Also add a simple window pattern
+                            patterns[app_name] = display_name.lower()
+                    except (IndexError, OSError):
+                        # Empty display name or unreadable install location, just continue
                         pass
-                    
-                    index += 1
-                    
-                except WindowsError:
-                    # No more subkeys
-                    break
-                    
+        
         except Exception as e:
             # Just continue with other discovery methods if registry access fails
             pass
     
-    def _discover_from_filesystem(self):
-        """Search for known applications in common paths"""
-        for app_name, exe_names in self.common_apps.items():
-            # Skip if already found
-            if app_name in self.app_registry:
-                continue
-                
-            # Search in all paths
-            for search_path in self.search_paths:
-                for exe_name in exe_names:
-                    # Check direct path
-                    exe_path = os.path.join(search_path, exe_name)
-                    if os.path.exists(exe_path):
-                        self.app_registry[app_name] = exe_path
-                        break
-                        
-                    # Check subdirectories (one level)
-                    try:
-                        for subdir in os.listdir(search_path):
-                            subdir_path = os.path.join(search_path, subdir)
-                            if os.path.isdir(subdir_path):
-                                exe_path = os.path.join(subdir_path, exe_name)
-                                if os.path.exists(exe_path):
-                                    self.app_registry[app_name] = exe_path
-                                    break
-                    except:
-                        # Permission error or other issue, just continue
-                        pass
-                
-                # Break if found
-                if app_name in self.app_registry:
+    def _discover_from_filesystem(self, apps: Dict[str, str], patterns: Dict[str, str]):
+        """
+        Search for known applications in common paths.
+        
+        Args:
+            apps (Dict[str, str]): Found application paths are added here
+            patterns (Dict[str, str]): Unused, this method finds no window patterns
+        """
+        # Each search path is listed at most once, even when search paths repeat
+        listings: Dict[str, Dict[str, os.DirEntry]] = {}
+        
+        # Search in all paths, earlier paths take precedence
+        for search_path in self.search_paths:
+            # Stop as soon as every known application has been found
+            if len(apps.keys() & self.common_apps.keys()) == len(self.common_apps):
+                break
+            
+            # Check direct path with one listing
+            entries = self._list_directory(search_path, listings)
+            self._match_executables(entries, apps)
+            
+            # Check subdirectories (one level). Only the executables still missing are
+            # probed, rather than listing directories like C:\Windows\WinSxS in full.
+            for entry in entries.values():
+                missing = [(exe_name, app_name) for exe_name, app_name in self._exe_to_app.items()
+                           if app_name not in apps]
+                if not missing:
                     break
+                if not entry.is_dir():
+                    continue
+                for exe_name, app_name in missing:
+                    exe_path = os.path.join(entry.path, exe_name)
+                    if app_name not in apps and os.path.isfile(exe_path):
+                        apps[app_name] = exe_path
+    
+    def _match_executables(self, entries: Dict[str, os.DirEntry], apps: Dict[str, str]):
+        """
+        Add the known applications found in one directory listing.
+        
+        Args:
+            entries (Dict[str, os.DirEntry]): Directory entries keyed by lowercased name
+            apps (Dict[str, str]): Found application paths are added here
+        """
+        for name, entry in entries.items():
+            app_name = self._exe_to_app.get(name)
+            if app_name and app_name not in apps:
+                apps[app_name] = entry.path
+    
+    def _list_directory(self, path: str,
+                        listings: Dict[str, Dict[str, os.DirEntry]]) -> Dict[str, os.DirEntry]:
+        """
+        List a directory with a single scandir, reusing earlier listings.
+        
+        Args:
+            path (str): Directory to list
+            listings (Dict[str, Dict[str, os.DirEntry]]): Directory listings read so far
+        
+        Returns:
+            Dict[str, os.DirEntry]: Entries keyed by lowercased name
+        """
+        if path not in listings:
+            try:
+                with os.scandir(path) as it:
+                    listings[path] = {entry.name.lower(): entry for entry in it}
+            except OSError:
+                # Permission error or other issue, treat as empty
+                listings[path] = {}
+        return listings[path]
     
-    def _discover_from_where_command(self):
-        """Use the where.exe command to find executables in PATH"""
+    def _discover_from_path(self, apps: Dict[str, str], patterns: Dict[str, str]):
+        """
+        Find executables in PATH, like where.exe but without starting a process per lookup.
+        
+        Args:
+            apps (Dict[str, str]): Found application paths are added here
+            patterns (Dict[str, str]): Unused, this method finds no window patterns
+        """
+        # Index every PATH directory once, earlier directories take precedence
+        index = {}
+        for directory in os.environ.get("PATH", "").split(os.pathsep):
+            if not directory:
+                continue
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        index.setdefault(entry.name.lower(), entry.path)
+            except OSError:
+                # Missing or unreadable directory, just continue
+                pass
+        
         for app_name, exe_names in self.common_apps.items():
             # Skip if already found
-            if app_name in self.app_registry:
+            if app_name in apps:
                 continue
-                
+            
             for exe_name in exe_names:
-                try:
-                    # Run where.exe to find the executable
-                    result = subprocess.run(
-                        ["where", exe_name], 
-                        capture_output=True, 
-                        text=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    
-                    if result.returncode == 0:
-                        # Get the first path found (usually the one that would be executed)
-                        paths = result.stdout.strip().split('\n')
-                        if paths:
-                            self.app_registry[app_name] = paths[0]
-                            break
-                except:
-                    # Command failed, just continue
-                    pass
+                exe_path = index.get(exe_name.lower())
+                if exe_path:
+                    apps[app_name] = exe_path
+                    break
     
     def get_app_path(self, app_name: str) -> Optional[str]:
         """
@@ -279,20 +646,54 @@ class AppRegistry:
         Returns:
             Optional[str]: Executable path or None if not found
         """
-        app_name = app_name.lower()
+        self._ensure_discovered()
+        return self._path_cache(app_name.lower())
+    
+    def _lookup_app_path(self, app_name: str) -> Optional[str]:
+        """
+        Look up the executable path for a lowercased application name, see get_app_path.
+        
+        Args:
+            app_name (str): Lowercased name of the application
         
+        Returns:
+            Optional[str]: Executable path or None if not found
+        """
         # Direct match in registry
         if app_name in self.app_registry:
             return self.app_registry[app_name]
         
-        # Try to find a partial match
-        for name, path in self.app_registry.items():
-            if app_name in name or name in app_name:
-                return path
+        # Try to find a close match, rapidfuzz scores every name in C
+        matches = [
+            match for match in process.extract(app_name, self.app_registry.keys(), scorer=fuzz.WRatio,
+                                               score_cutoff=APP_MATCH_CUTOFF, limit=None)
+            if self._is_plausible_match(app_name, match[0])
+        ]
+        if matches:
+            # Break ties between equal scores the same way as window patterns, then
+            # by registry order, which has App Paths entries first
+            name = max(matches, key=lambda match: (
+                match[1], *_rank_match(app_name, match[0], self.common_apps), -match[2]
+            ))[0]
+            return self.app_registry[name]
         
         # Try to find the application on-demand
         return self._find_app_on_demand(app_name)
     
+    def _is_plausible_match(self, app_name: str, name: str) -> bool:
+        """
+        Check a fuzzy match is a whole word of the lookup, or the other way round,
+        or a near spelling of it. WRatio alone scores "word" against "wordpad" 90.
+        
+        Args:
+            app_name (str): Lowercased name being looked up
+            name (str): Lowercased name that matched
+        
+        Returns:
+            bool: True if the match can be used
+        """
+        return _rank_match(app_name, name, ())[0] or fuzz.ratio(app_name, name) >= APP_MATCH_CUTOFF
+    
     def _find_app_on_demand(self, app_name: str) -> Optional[str]:
         """
         Attempt to find an application that wasn't in the initial discovery.
@@ -320,6 +721,8 @@ class AppRegistry:
                 if paths:
                     # Cache the result for future use
                     self.app_registry[app_name] = paths[0]
+                    self._path_cache.cache_clear()
+                    self._save_cache()
                     return paths[0]
         except:
             pass
@@ -335,21 +738,52 @@ class AppRegistry:
             app_name (str): User-friendly name of the application
             
         Returns:
-            Optional[str]: Window title pattern or None if not found
+            Optional[str]: Lowercased window title pattern or None if not found
+        """
+        self._ensure_discovered()
+        return self._pattern_cache(app_name.lower())
+    
+    def _lookup_window_pattern(self, app_name: str) -> str:
         """
-        app_name = app_name.lower()
+        Look up the window title pattern for a lowercased application name, see get_window_pattern.
+        
+        Args:
+            app_name (str): Lowercased name of the application
         
+        Returns:
+            str: Lowercased window title pattern
+        """
         # Direct match in patterns
         if app_name in self.window_patterns:
             return self.window_patterns[app_name]
         
         # Try to find a partial match
-        for name, pattern in self.window_patterns.items():
-            if app_name in name or name in app_name:
-                return pattern
+        name = self._pattern_index.find(app_name, self.common_apps)
+        if name:
+            return self.window_patterns[name]
         
         # Fallback to using the app name itself as the pattern
-        return app_name.title()
+        return app_name
+    
+    def get_window_regex(self, app_name: str) -> Optional[re.Pattern]:
+        """
+        Get a compiled, case-insensitive regex for an application's window title pattern.
+        
+        Args:
+            app_name (str): User-friendly name of the application
+        
+        Returns:
+            Optional[re.Pattern]: Window title regex or None if not found
+        """
+        pattern = self.get_window_pattern(app_name)
+        if not pattern:
+            return None
+        
+        regex = self._pattern_re_cache.get(pattern)
+        if regex is None:
+            regex = re.compile(re.escape(pattern), re.IGNORECASE)
+            self._pattern_re_cache[pattern] = regex
+        return regex
     
     def add_app(self, name: str, path: str, window_pattern: Optional[str] = None):
         """
@@ -360,11 +794,17 @@ class AppRegistry:
             path (str): Executable path
             window_pattern (Optional[str]): Window title pattern for closing
         """
+        self._ensure_discovered()
         name = name.lower()
         self.app_registry[name] = path
+        self._pattern_index.add(name)
         
         if window_pattern:
-            self.window_patterns[name] = window_pattern
+            self.window_patterns[name] = window_pattern.lower()
         else:
             # Use name as fallback window pattern
-            self.window_patterns[name] = name.title()
+            self.window_patterns[name] = name
+        
+        self._path_cache.cache_clear()
+        self._pattern_cache.cache_clear()
+        self._save_cache()
@@ -5,6 +5,7 @@ This will create a properly formatted .env file for the application.
 
 import os
 import sys
+from pathlib import Path
 
 def create_env_file():
     """Creates a properly formatted .env file in the current directory."""
@@ -24,12 +25,10 @@ def create_env_file():
         return
     
     # Default model to use
-    model = "gpt-4o"
+    model = "gpt-4o-mini"
     
-    # Write the .env file with proper formatting
-    with open(env_path, 'w') as f:
-        f.write(f"OPENAI_API_KEY={api_key}\n")
-        f.write(f"OPENAI_MODEL={model}\n")
+    # Write the .env file with proper formatting, in a single write
+    Path(env_path).write_text(f"OPENAI_API_KEY={api_key}\nOPENAI_MODEL={model}\n")
     
     print(f".env file created successfully at {env_path}")
     print("The file contains:")
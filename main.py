@@ -3,16 +3,29 @@ AI Task Launcher - A Windows assistant that transforms natural language into com
 Run this script to start the assistant in interactive mode.
 """
 
-from app_controller import AppController
+import os
+import logging
+import threading
 
 def main():
+    # Set LOGLEVEL=DEBUG to see the raw model responses. getLevelName maps a
+    # known level name to its number, anything else falls back to WARNING.
+    level = logging.getLevelName(os.environ.get("LOGLEVEL", "WARNING").upper())
+    logging.basicConfig(level=level if isinstance(level, int) else logging.WARNING)
+    
     print("=======================================")
     print("AI Task Launcher - Your Windows Assistant")
     print("=======================================")
     print("Type 'exit' or 'quit' to end the session")
     
+    # Imported after the banner so it shows while the dependencies load
+    from app_controller import AppController
+    
     controller = AppController()
     
+    # Discover applications and connect to the API while the user types
+    threading.Thread(target=controller.warm_up, daemon=True).start()
+    
     while True:
         try:
             user_input = input("\nHow can I help you? > ")
@@ -1,25 +1,166 @@
 import os
-import openai
-from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional, Literal
+import re
+import atexit
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
 import json
-from dotenv import load_dotenv
-import httpx
+import logging
 
-class CommandIntent(BaseModel):
-    """Model representing the parsed intent from user input"""
-    action: Literal["open", "close", "search", "unknown"] = Field(
-        description="The primary action to perform"
-    )
-    application: Optional[str] = Field(
-        None, description="Target application for open/close commands"
-    )
-    query: Optional[str] = Field(
-        None, description="Search query for search commands"
-    )
-    parameters: Dict[str, Any] = Field(
-        default_factory=dict, description="Additional parameters for the action"
-    )
+log = logging.getLogger(__name__)
+
+# Compact system prompt; intent classification doesn't need long instructions
+_SYSTEM_PROMPT = (
+    'Classify a Windows assistant command. Reply with JSON only: '
+    '{"action":"open|close|search","application":"app name","query":"search query"}. '
+    'Questions and lookups are "search" with a clear Google query. Examples: '
+    '"Open Chrome"->{"action":"open","application":"Chrome"}; '
+    '"Close Word"->{"action":"close","application":"Word"}; '
+    '"How tall is the Burj Khalifa?"->{"action":"search","query":"height of Burj Khalifa"}'
+)
+
+# The JSON reply is a handful of short fields
+MAX_RESPONSE_TOKENS = 60
+
+# Obvious commands are classified locally without calling the API. App names
+# are limited to two words so longer requests still go to the model.
+_OPEN_RE = re.compile(r'^\s*(?:open|launch|start|run)\s+(\S+(?:\s+\S+)?)\s*$', re.IGNORECASE)
+_CLOSE_RE = re.compile(r'^\s*(?:close|exit|quit|kill|stop)\s+(\S+(?:\s+\S+)?)\s*$', re.IGNORECASE)
+_SEARCH_RE = re.compile(r'^\s*(?:look up|search for|find|how|what|when|where|who|why|google)\b', re.IGNORECASE)
+
+# One pooled HTTP/2 client shared by every NLPProcessor, so repeated
+# requests reuse the TLS connection instead of handshaking again
+_http_client = None
+
+def _get_http_client():
+    """
+    Create the shared HTTP client on first use.
+    
+    Returns:
+        httpx.Client: Pooled HTTP/2 client for the OpenAI API
+    """
+    global _http_client
+    if _http_client is None:
+        # Imported here so the assistant starts without waiting for httpx
+        import httpx
+        
+        _http_client = httpx.Client(
+            base_url="https://api.openai.com",
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            follow_redirects=True
+        )
+        atexit.register(_http_client.close)
+    return _http_client
+
+# Actions the assistant knows how to perform
+ACTIONS = ("open", "close", "search", "unknown")
+
+@dataclass
+class CommandIntent:
+    """Parsed intent from user input"""
+    # The primary action to perform, one of ACTIONS
+    action: str = "unknown"
+    # Target application for open/close commands
+    application: Optional[str] = None
+    # Search query for search commands
+    query: Optional[str] = None
+    # Additional parameters for the action
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        # Validate what the model returned, since nothing else checks it
+        if self.action not in ACTIONS:
+            raise ValueError(f"Unsupported action: {self.action!r}")
+        if not isinstance(self.parameters, dict):
+            raise ValueError("parameters must be an object")
+        for name in ("application", "query"):
+            if not isinstance(getattr(self, name), (str, type(None))):
+                raise ValueError(f"{name} must be a string")
+    
+    @classmethod
+    def from_json(cls, text: str) -> "CommandIntent":
+        """
+        Build an intent from the model's JSON reply in a single parse.
+        
+        Args:
+            text (str): JSON object returned by the model
+        
+        Returns:
+            CommandIntent: Parsed intent, falling back to search or unknown if it's invalid
+        """
+        result = json.loads(text)
+        
+        # Handle different JSON format possibilities
+        if "intent" in result and "action" not in result:
+            result["action"] = result.pop("intent")
+        
+        # Ensure we have all required fields
+        if not result.get("action"):
+            result["action"] = "unknown"
+        
+        try:
+            return cls(**{
+                key: result[key]
+                for key in ("action", "application", "query", "parameters")
+                if key in result
+            })
+        except Exception as e:
+            print(f"Error creating CommandIntent: {e}")
+            # Create a default intent object with the available data
+            query = result.get("query")
+            application = result.get("application")
+            return cls(
+                action="search" if query and isinstance(query, str) else "unknown",
+                application=application if isinstance(application, str) else None,
+                query=query if isinstance(query, str) else None
+            )
+
+def _read_json_object(stream) -> str:
+    """
+    Accumulate streamed completion chunks until the top-level JSON object closes.
+    
+    Args:
+        stream: Streaming chat completion response
+    
+    Returns:
+        str: Text of the JSON object, or everything received if it never closed
+    """
+    buffer = []
+    depth = 0
+    in_string = False
+    escaped = False
+    
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        buffer.append(delta)
+        
+        # Track brace depth outside of strings so we can stop at the closing brace
+        for char in delta:
+            if escaped:
+                escaped = False
+            elif in_string:
+                if char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    # Don't wait for trailing whitespace or the end of the stream
+                    stream.response.close()
+                    return "".join(buffer)
+    
+    return "".join(buffer)
 
 class NLPProcessor:
     """
@@ -28,6 +169,9 @@ class NLPProcessor:
     """
     
     def __init__(self):
+        # Imported here rather than at module level so the banner shows first
+        from dotenv import load_dotenv
+        
         # Ensure environment variables are loaded
         load_dotenv()
         
@@ -36,19 +180,33 @@ class NLPProcessor:
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
         
-        # Create a custom HTTP client without proxies
-        http_client = httpx.Client(
-            base_url="https://api.openai.com",
-            timeout=60.0,
-            follow_redirects=True
-        )
+        self._api_key = api_key
+        self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         
-        # Initialize OpenAI client
-        self.client = openai.OpenAI(
-            api_key=api_key,
-            http_client=http_client
-        )
-        self.model = os.getenv("OPENAI_MODEL", "gpt-4o")
+        # Created on first use, see client
+        self._client = None
+        self._client_lock = threading.Lock()
+    
+    @property
+    def client(self):
+        """
+        The OpenAI client, created the first time it is needed.
+        
+        The openai package is slow to import, so AppController.warm_up touches
+        this on a background thread while the user types their first command.
+        """
+        if self._client is None:
+            # Warm-up and the first command may get here at the same time
+            with self._client_lock:
+                if self._client is None:
+                    import openai
+                    
+                    # Initialize OpenAI client on the shared HTTP client
+                    self._client = openai.OpenAI(
+                        api_key=self._api_key,
+                        http_client=_get_http_client()
+                    )
+        return self._client
     
     def process_input(self, user_input: str) -> tuple:
         """
@@ -60,69 +218,36 @@ class NLPProcessor:
         Returns:
             tuple: (intent, params) where intent is the determined action and params are extracted parameters
         """
-        system_prompt = """
-        You are an AI assistant that interprets user commands for a Windows computer assistant.
-        Analyze the user's input and identify the most likely intent from these options:
-        
-        1. Open an application (action: "open") - When the user wants to launch or start a program
-        2. Close an application (action: "close") - When the user wants to exit or terminate a program
-        3. Search for information (action: "search") - When the user is asking a question, looking for information, or wants to look something up
-        
-        Be flexible in your interpretation. If the user's query contains phrases like "look up", "search for", "find information about", "how to", "what is", or any question formats, treat it as a search intent.
-        
-        For search queries, extract the full search query the user likely wants answered. Formulate a clear, comprehensive search query that would yield good results on Google.
-        
-        Example interpretations:
-        - "Open Chrome" → Intent: open, Application: Chrome
-        - "Close Word" → Intent: close, Application: Word
-        - "Look up the weather" → Intent: search, Query: "current weather forecast"
-        - "How tall is the Burj Khalifa?" → Intent: search, Query: "height of Burj Khalifa"
-        - "Find information about Mars" → Intent: search, Query: "facts about Mars planet"
-        
-        RESPOND WITH A JSON OBJECT that has the following structure:
-        {
-            "action": "open|close|search",
-            "application": "app name" (only for open/close),
-            "query": "search query" (only for search)
-        }
-
-        Always include "action" field with exactly one of the values: "open", "close", or "search".
-        """
+        # Skip the network round trip for commands that match a simple pattern
+        match = _OPEN_RE.match(user_input)
+        if match:
+            return "open", {"application": match.group(1)}
+        
+        match = _CLOSE_RE.match(user_input)
+        if match:
+            return "close", {"application": match.group(1)}
+        
+        if _SEARCH_RE.match(user_input):
+            return "search", {"query": user_input}
         
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
                 response_format={"type": "json_object"},
+                max_tokens=MAX_RESPONSE_TOKENS,
+                temperature=0,
+                seed=0,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": f"Interpret this command: {user_input}"}
-                ]
+                ],
+                stream=True
             )
             
-            # Parse the JSON response
-            result_json = response.choices[0].message.content
-            print(f"Raw response: {result_json}")  # For debugging
-            result = json.loads(result_json)
-            
-            # Handle different JSON format possibilities
-            if "intent" in result and "action" not in result:
-                result["action"] = result.pop("intent")
-                
-            # Ensure we have all required fields
-            if "action" not in result or not result["action"]:
-                result["action"] = "unknown"
-                
-            # Convert to CommandIntent model
-            try:
-                intent_obj = CommandIntent(**result)
-            except Exception as e:
-                print(f"Error creating CommandIntent: {e}")
-                # Create a default intent object with the available data
-                intent_obj = CommandIntent(
-                    action="search" if "query" in result and result["query"] else "unknown",
-                    application=result.get("application"),
-                    query=result.get("query")
-                )
+            # Parse the JSON response as soon as the object is complete
+            result_json = _read_json_object(response)
+            log.debug("Raw response: %s", result_json)
+            intent_obj = CommandIntent.from_json(result_json)
             
             # Extract intent and parameters
             intent = intent_obj.action
@@ -137,19 +262,9 @@ class NLPProcessor:
         except Exception as e:
             print(f"Error processing input: {e}")
             
-            # In case of error, try to handle common search patterns directly
-            lower_input = user_input.lower()
-            if (lower_input.startswith("look up") or 
-                lower_input.startswith("search for") or 
-                lower_input.startswith("find") or
-                lower_input.startswith("how") or
-                lower_input.startswith("what") or
-                lower_input.startswith("when") or
-                lower_input.startswith("where") or
-                lower_input.startswith("who") or
-                lower_input.startswith("why") or
-                "?" in lower_input):
-                
+            # In case of error, treat questions as searches. Only here, since polite
+            # commands like "Can you open Spotify?" are questions too.
+            if "?" in user_input:
                 return "search", {"query": user_input}
-                
+            
             return "unknown", {"error": str(e)}